@@ -9,6 +9,14 @@ __version__ = "2.0.0"
 __author__ = "DAD-FW Contributors" 
 __description__ = "Data Agent Development Framework - Object-Oriented Version"
 
-from .core import FrameworkUtils, DataAgent, FabricDataAgentClient
+from .core import FrameworkUtils, DataAgent
 
-__all__ = ['FrameworkUtils', 'DataAgent', 'FabricDataAgentClient']
\ No newline at end of file
+__all__ = ['FrameworkUtils', 'DataAgent', 'FabricDataAgentClient']
+
+
+def __getattr__(name):
+    # Resolved through dad_fw.core on first access to keep azure.identity and openai off the import path
+    if name == 'FabricDataAgentClient':
+        from .core import FabricDataAgentClient
+        return FabricDataAgentClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,7 @@ Data Agent Development Framework (DAD-FW) CLI - Object-Oriented Version
 Main command-line interface for managing Fabric data agents.
 """
 
+import logging
 import typer
 from rich.console import Console
 from pathlib import Path
@@ -22,6 +23,14 @@ app = typer.Typer(
 
 console = Console()
 
+# Show framework progress messages (job status, runtimes) as plain lines on stdout
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+_framework_logger = logging.getLogger("dad_fw")
+_framework_logger.addHandler(_handler)
+_framework_logger.setLevel(logging.INFO)
+_framework_logger.propagate = False
+
 # Main workflow commands (easily accessible via direct command call instead of sub group command)
 app.command("init", help="Initialize a new data agent")(workflow.init)
 app.command("list", help="List all data agents")(workflow.list_cmd)
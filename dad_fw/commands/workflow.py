@@ -4,13 +4,15 @@ This file contains the key workflow commands for the typer cli.py file.
 import typer
 from rich.console import Console
 from rich import print as rprint
-from typing import Optional
+from typing import List, Optional, Tuple
 import os
 import sys
 import json
 import shutil
+import logging
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from dad_fw.core.framework_utils import FrameworkUtils
 from dad_fw.core.fabric_api import FabricAPI
@@ -21,6 +23,156 @@ sys.path.insert(0, str(current_dir))
 
 app = typer.Typer()
 
+# Upper bound on agents uploaded or run at the same time by --all-agents
+_MAX_PARALLEL_AGENTS = 16
+
+# FabricAPI's run progress logger (per-poll status lines at INFO)
+_fabric_api_logger = logging.getLogger("dad_fw.core.fabric_api")
+
+
+def _upload_agent(agent, workspace_id: Optional[str], use_ipynb: bool, force_update: bool) -> Tuple[dict, List[str]]:
+    """Upload one agent for `upload --all-agents`, returning its result and the lines to print."""
+    lines = []
+    try:
+        lines.append(f"\n[bold blue]Uploading Data Agent: {agent.name}[/bold blue]")
+
+        # Show upload details
+        display_name = agent.name
+        if workspace_id:
+            lines.append(f"[cyan]Using workspace ID: {workspace_id}[/cyan]")
+        else:
+            lines.append("[cyan]Using workspace ID from agent config[/cyan]")
+        
+        lines.append(f"[cyan]Notebook name: {display_name}[/cyan]")
+        
+        if use_ipynb:
+            lines.append("[cyan]Uploading as raw .ipynb file...[/cyan]")
+        else:
+            lines.append("[cyan]Uploading as Fabric Python format...[/cyan]")
+            # Check if auto-compile is needed
+            fabric_file = agent.get_fabric_python_file()
+            if not fabric_file.exists():
+                lines.append("[cyan]Auto-compiling notebook...[/cyan]")
+        
+        # Upload to Fabric (override workspace_id if provided via -w flag)
+        result = agent.upload_to_fabric(
+            workspace_id=workspace_id,  # This will override config if provided
+            notebook_name=None,  # Use default agent name
+            use_ipynb=use_ipynb,
+            force_update=force_update,
+            ask_before_update=False  # Never ask in --all-agents mode
+        )
+        
+        # Show success message
+        if result and result.get('updated'):
+            lines.append(f"[green]Successfully updated existing notebook in Fabric![/green]")
+        else:
+            lines.append(f"[green]Successfully uploaded new notebook to Fabric![/green]")
+        
+        lines.append(f"[green]Notebook Name: {display_name}[/green]")
+        
+        # Show additional details if available
+        if result and isinstance(result, dict) and "id" in result:
+            lines.append(f"[dim]Notebook ID: {result['id']}[/dim]")
+
+        lines.append("[dim]Updated agent config with upload info[/dim]")
+        
+        return {
+            'agent': agent.name,
+            'success': True,
+            'updated': result.get('updated', False) if result else False
+        }, lines
+        
+    except Exception as e:
+        lines.append(f"[red]Failed to upload agent: {e}[/red]")
+        return {
+            'agent': agent.name,
+            'success': False,
+            'error': str(e)
+        }, lines
+
+
+def _run_agent(agent, workspace_id: Optional[str]) -> Tuple[dict, List[str]]:
+    """Run one agent for `run --all-agents`, returning its result and the lines to print."""
+    lines = []
+    try:
+        lines.append(f"\n[bold blue]Running Data Agent: {agent.name}[/bold blue]")
+        
+        # Load config to show execution details
+        config = agent.load_config()
+        
+        # Show execution details
+        if workspace_id:
+            lines.append(f"[cyan]Using workspace ID: {workspace_id}[/cyan]")
+        else:
+            lines.append("[cyan]Using workspace ID from agent config[/cyan]")
+        
+        notebook_name = config.get("notebook_name")
+        notebook_id = config.get("notebook_id")
+        
+        if notebook_name:
+            lines.append(f"[cyan]Notebook: {notebook_name}[/cyan]")
+        elif notebook_id:
+            lines.append(f"[cyan]Notebook ID: {notebook_id}[/cyan]")
+        else:
+            lines.append("[yellow]No notebook info found. Make sure the agent has been uploaded first.[/yellow]")
+            return {
+                'agent': agent.name,
+                'success': False,
+                'error': 'Agent not uploaded yet. Upload first before running.'
+            }, lines
+        
+        # Progress is printed as it happens, labelled with the agent; the rest of the
+        # block is buffered and printed once the run is done
+        rprint(f"[cyan]{agent.name}: Starting execution...[/cyan]")
+        
+        def on_status_change(job_instance) -> None:
+            rprint(f"[dim]{agent.name}: {job_instance.status}[/dim]")
+        
+        # Use the agent's run method (override workspace_id if provided via -w flag)
+        result = agent.run_in_fabric(workspace_id=workspace_id, on_status_change=on_status_change)  # This will override config if provided
+        
+        # Show execution summary
+        lines.append(f"\n[bold]Execution Summary:[/bold]")
+        lines.append(f"[green]Status: {result['status']}[/green]" if result['success'] else f"[red]Status: {result['status']}[/red]")
+        lines.append(f"Runtime: {result['total_runtime_str']}")
+        lines.append(f"[dim]Job ID: {result['job_id']}[/dim]")
+        
+        # Show data agent info if found
+        if result.get('agent_found'):
+            lines.append(f"\n[bold green]Data Agent Created:[/bold green]")
+            lines.append(f"Agent Name: {result['agent_display_name']}")
+            lines.append(f"Agent ID: {result['agent_id']}")
+            lines.append(f"[green]Agent URL: {result['agent_url']}[/green]")
+        elif result['success']:
+            lines.append(f"\n[yellow]Data agent may have been created, but could not be found automatically.[/yellow]")
+            lines.append(f"[dim]Check the Fabric workspace for the new agent.[/dim]")
+        
+        if result['success']:
+            lines.append(f"[green]Data agent '{agent.name}' executed successfully![/green]")
+            lines.append("[dim]Your data agent should now be available in Fabric[/dim]")
+        else:
+            lines.append(f"[red]Execution failed for '{agent.name}'[/red]")
+            lines.append("[dim]Check the notebook in Fabric workspace for error details[/dim]")
+        
+        return {
+            'agent': agent.name,
+            'success': result['success'],
+            'agent_found': result.get('agent_found', False),
+            'agent_display_name': result.get('agent_display_name'),
+            'agent_url': result.get('agent_url'),
+            'error': None if result['success'] else result['status']
+        }, lines
+        
+    except Exception as e:
+        lines.append(f"[red]Failed to run agent: {e}[/red]")
+        return {
+            'agent': agent.name,
+            'success': False,
+            'error': str(e)
+        }, lines
+
+
 @app.command()
 def init(
     name: str = typer.Argument(..., help="Name of the data agent to create"),
@@ -109,11 +261,12 @@ def compile(
                 sys.exit(1)
             
             # Check if notebook exists
-            if not agent.get_notebook_file().exists():
-                rprint(f"[red]Notebook file not found: {agent.get_notebook_file()}[/red]")
+            notebook_file = agent.get_notebook_file()
+            if not notebook_file.exists():
+                rprint(f"[red]Notebook file not found: {notebook_file}[/red]")
                 sys.exit(1)
             
-            rprint(f"[cyan]Converting notebook: {agent.get_notebook_file()}[/cyan]")
+            rprint(f"[cyan]Converting notebook: {notebook_file}[/cyan]")
             
             # Build custom output path if custom directory or name is provided
             output_file_path = None
@@ -136,8 +289,8 @@ def compile(
                 agent.set_fabric_python_file(output_file_path)
                 rprint(f"[cyan]Full output path: {output_file_path}[/cyan]")
             
-            # Convert notebook to Fabric Python format
-            result = agent.convert_ipynb_to_fabric_python(
+            # Convert notebook to Fabric Python format (returns the number of bytes written)
+            file_size = agent.convert_ipynb_to_fabric_python(
                 output_file_path=output_file_path
             )
             
@@ -145,7 +298,6 @@ def compile(
             rprint(f"[green]✓ Successfully compiled to: {output_file}[/green]")
             
             # Show file size
-            file_size = output_file.stat().st_size
             rprint(f"[dim]File size: {file_size:,} bytes[/dim]")
             
         except Exception as e:
@@ -274,70 +426,16 @@ def upload(
             
         rprint(f"[cyan]Found {len(agents)} agents to upload[/cyan]")
         
-        # Track results for summary
+        # Uploads are dominated by Fabric round trips, so overlap them; each agent's
+        # output is buffered and printed as one block, in agent order
         results = []
-        
-        # Upload each agent using the same logic as single agent uploads
-        for agent in agents:
-            try:
-                rprint(f"\n[bold blue]Uploading Data Agent: {agent.name}[/bold blue]")
-                agent.load_config()
-
-                # Show upload details
-                display_name = agent.name
-                if workspace_id:
-                    rprint(f"[cyan]Using workspace ID: {workspace_id}[/cyan]")
-                else:
-                    rprint("[cyan]Using workspace ID from agent config[/cyan]")
-                
-                rprint(f"[cyan]Notebook name: {display_name}[/cyan]")
-                
-                if use_ipynb:
-                    rprint("[cyan]Uploading as raw .ipynb file...[/cyan]")
-                else:
-                    rprint("[cyan]Uploading as Fabric Python format...[/cyan]")
-                    # Check if auto-compile is needed
-                    fabric_file = agent.get_fabric_python_file()
-                    if not fabric_file.exists():
-                        rprint("[cyan]Auto-compiling notebook...[/cyan]")
-                
-                # Upload to Fabric (override workspace_id if provided via -w flag)
-                result = agent.upload_to_fabric(
-                    workspace_id=workspace_id,  # This will override config if provided
-                    notebook_name=None,  # Use default agent name
-                    use_ipynb=use_ipynb,
-                    force_update=force_update_all,
-                    ask_before_update=False  # Never ask in --all-agents mode
-                )
-                
-                # Show success message
-                if result and result.get('updated'):
-                    rprint(f"[green]Successfully updated existing notebook in Fabric![/green]")
-                else:
-                    rprint(f"[green]Successfully uploaded new notebook to Fabric![/green]")
-                
-                rprint(f"[green]Notebook Name: {display_name}[/green]")
-                
-                # Show additional details if available
-                if result and isinstance(result, dict) and "id" in result:
-                    rprint(f"[dim]Notebook ID: {result['id']}[/dim]")
-
-                rprint("[dim]Updated agent config with upload info[/dim]")
-                
-                # Track success
-                results.append({
-                    'agent': agent.name,
-                    'success': True,
-                    'updated': result.get('updated', False) if result else False
-                })
-                
-            except Exception as e:
-                rprint(f"[red]Failed to upload agent: {e}[/red]")
-                results.append({
-                    'agent': agent.name,
-                    'success': False,
-                    'error': str(e)
-                })
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_AGENTS, len(agents))) as pool:
+            futures = [pool.submit(_upload_agent, agent, workspace_id, use_ipynb, force_update_all) for agent in agents]
+            for future in futures:
+                result, lines = future.result()
+                for line in lines:
+                    rprint(line)
+                results.append(result)
         
         # Show summary
         successful = [r for r in results if r['success']]
@@ -365,7 +463,6 @@ def upload(
             if not agent:
                 rprint(f"[red]Agent '{name}' not found in {base_dir}[/red]")
                 sys.exit(1)
-            agent.load_config()
 
             # Show upload details
             display_name = notebook_name if notebook_name else agent.name
@@ -432,84 +529,23 @@ def run(
             
         rprint(f"[cyan]Found {len(agents)} agents to run[/cyan]")
         
-        # Track results for summary
+        # Runs spend their time waiting on Fabric jobs, so monitor them concurrently.
+        # Each agent prints labelled start and status-change lines as they happen, and its
+        # details as one block in agent order; FabricAPI's unlabelled per-poll lines would
+        # interleave, so they are held back meanwhile.
         results = []
-        
-        # Run each agent using the same logic as single agent runs
-        for agent in agents:
-            try:
-                rprint(f"\n[bold blue]Running Data Agent: {agent.name}[/bold blue]")
-                
-                # Load config to show execution details
-                config = agent.load_config()
-                
-                # Show execution details
-                if workspace_id:
-                    rprint(f"[cyan]Using workspace ID: {workspace_id}[/cyan]")
-                else:
-                    rprint("[cyan]Using workspace ID from agent config[/cyan]")
-                
-                notebook_name = config.get("notebook_name")
-                notebook_id = config.get("notebook_id")
-                
-                if notebook_name:
-                    rprint(f"[cyan]Notebook: {notebook_name}[/cyan]")
-                elif notebook_id:
-                    rprint(f"[cyan]Notebook ID: {notebook_id}[/cyan]")
-                else:
-                    rprint("[yellow]No notebook info found. Make sure the agent has been uploaded first.[/yellow]")
-                    results.append({
-                        'agent': agent.name,
-                        'success': False,
-                        'error': 'Agent not uploaded yet. Upload first before running.'
-                    })
-                    continue
-                
-                rprint("[cyan]Starting execution...[/cyan]")
-                
-                # Use the agent's run method (override workspace_id if provided via -w flag)
-                result = agent.run_in_fabric(workspace_id=workspace_id)  # This will override config if provided
-                
-                # Show execution summary
-                rprint(f"\n[bold]Execution Summary:[/bold]")
-                rprint(f"[green]Status: {result['status']}[/green]" if result['success'] else f"[red]Status: {result['status']}[/red]")
-                rprint(f"Runtime: {result['total_runtime_str']}")
-                rprint(f"[dim]Job ID: {result['job_id']}[/dim]")
-                
-                # Show data agent info if found
-                if result.get('agent_found'):
-                    rprint(f"\n[bold green]Data Agent Created:[/bold green]")
-                    rprint(f"Agent Name: {result['agent_display_name']}")
-                    rprint(f"Agent ID: {result['agent_id']}")
-                    rprint(f"[green]Agent URL: {result['agent_url']}[/green]")
-                elif result['success']:
-                    rprint(f"\n[yellow]Data agent may have been created, but could not be found automatically.[/yellow]")
-                    rprint(f"[dim]Check the Fabric workspace for the new agent.[/dim]")
-                
-                if result['success']:
-                    rprint(f"[green]Data agent '{agent.name}' executed successfully![/green]")
-                    rprint("[dim]Your data agent should now be available in Fabric[/dim]")
-                else:
-                    rprint(f"[red]Execution failed for '{agent.name}'[/red]")
-                    rprint("[dim]Check the notebook in Fabric workspace for error details[/dim]")
-                
-                # Track results
-                results.append({
-                    'agent': agent.name,
-                    'success': result['success'],
-                    'agent_found': result.get('agent_found', False),
-                    'agent_display_name': result.get('agent_display_name'),
-                    'agent_url': result.get('agent_url'),
-                    'error': None if result['success'] else result['status']
-                })
-                
-            except Exception as e:
-                rprint(f"[red]Failed to run agent: {e}[/red]")
-                results.append({
-                    'agent': agent.name,
-                    'success': False,
-                    'error': str(e)
-                })
+        previous_level = _fabric_api_logger.level
+        _fabric_api_logger.setLevel(logging.WARNING)
+        try:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_AGENTS, len(agents))) as pool:
+                futures = [pool.submit(_run_agent, agent, workspace_id) for agent in agents]
+                for future in futures:
+                    result, lines = future.result()
+                    for line in lines:
+                        rprint(line)
+                    results.append(result)
+        finally:
+            _fabric_api_logger.setLevel(previous_level)
         
         # Show summary
         successful = [r for r in results if r['success']]
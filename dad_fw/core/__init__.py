@@ -4,11 +4,18 @@ Simple core classes for the Data Agent Development Framework.
 
 from .data_agent import DataAgent
 from .framework_utils import FrameworkUtils
-from .fabric_data_agent_client import FabricDataAgentClient
 
 
 __all__ = [
     'DataAgent',
     'FrameworkUtils',
     'FabricDataAgentClient'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # FabricDataAgentClient pulls in azure.identity and openai, so load it on first access
+    if name == 'FabricDataAgentClient':
+        from .fabric_data_agent_client import FabricDataAgentClient
+        return FabricDataAgentClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
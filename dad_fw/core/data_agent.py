@@ -1,40 +1,107 @@
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, Callable
+import copy
 import json
+import os
 import shutil
+import time
 
 from dad_fw.core.fabric_api import FabricAPI
 
+# Bundled notebook/readme templates
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Buffer size for streaming compiled notebooks to disk
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Constant blocks of the Fabric Python notebook format
+_META_HEADER = (
+    b"# Fabric notebook source\n\n"
+    b"# METADATA ********************\n\n"
+    b"# META {\n"
+    b"# META   \"kernel_info\": {\n"
+    b"# META     \"name\": \"synapse_pyspark\"\n"
+    b"# META   }\n"
+    b"# META }\n\n"
+)
+_CELL_HEADER = b"# CELL ********************\n\n"
+_PARAM_HEADER = b"# PARAMETERS CELL ********************\n\n"
+_MARKDOWN_HEADER = b"# MARKDOWN ********************\n\n"
+_META_PY = (
+    b"# METADATA ********************\n\n"
+    b"# META {\n"
+    b"# META   \"language\": \"python\",\n"
+    b"# META   \"language_group\": \"synapse_pyspark\"\n"
+    b"# META }\n\n"
+)
+_META_SQL = (
+    b"# METADATA ********************\n\n"
+    b"# META {\n"
+    b"# META   \"language\": \"sparksql\",\n"
+    b"# META   \"language_group\": \"synapse_pyspark\"\n"
+    b"# META }\n\n"
+)
+
+# Cell language for cell magics; any other % / %% magic is treated as Python
+_MAGIC_LANG = {"%%sql": "sparksql", "%%configure": "python"}
+
+# Maps spaces and hyphens to underscores when normalizing agent and folder names
+_UNDERSCORE_TABLE = str.maketrans(" -", "__")
+
+# Last formatted timestamp as (epoch second, string), reused while the second is unchanged.
+# Kept as one tuple so concurrent callers always see a matching pair.
+_last_ts = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO 8601 string (second precision)."""
+    global _last_ts
+    now = int(time.time())
+    cached = _last_ts
+    if cached[0] == now:
+        return cached[1]
+    ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+    _last_ts = (now, ts)
+    return ts
+
+
 class DataAgent:
     """A simple data agent with basic operations."""
 
+    __slots__ = (
+        '_name', '_folder_name', '_base_dir', '_agent_dir',
+        '_config_file', '_notebook_file', '_readme_file', '_testing_file', '_fabric_python_file',
+        '_config_cache', '_config_mtime', '_dir_ensured', '__config',
+    )
+
     def __init__(self, name: str, base_dir: Path):
         self._name = name
-        self._folder_name = name.replace(" ", "_").replace("-", "_").lower()
+        self._folder_name = DataAgent.folder_name_for(name)
         self._base_dir = base_dir
         self._agent_dir = base_dir / self._folder_name
 
-        # Simple file paths
-        self._config_file = self._agent_dir / "config.json"
-        self._notebook_file = self._agent_dir / f"{self._folder_name}.ipynb"
-        self._readme_file = self._agent_dir / "README.md"
-        self._testing_file = self._agent_dir / f"{self._folder_name}_testing.ipynb"
+        # Simple file paths, kept as strings and only wrapped in Path by the getters
+        prefix = f"{self._agent_dir}{os.sep}"
+        self._config_file = f"{prefix}config.json"
+        self._notebook_file = f"{prefix}{self._folder_name}.ipynb"
+        self._readme_file = f"{prefix}README.md"
+        self._testing_file = f"{prefix}{self._folder_name}_testing.ipynb"
         self._fabric_python_file = None # File for compile notebook
 
-        # Default config
-        self._config: Dict[str, Any] = {
-            "agent_name": self._name,
-            "folder_name": self._folder_name,
-            "created_date": datetime.now().isoformat(),
-            "workspace_id": "",
-            "status": "scaffolded",
-            "tenant_id": "",
-            "notebook_id": "",
-            "notebook_name": "",
-            "agent_id": "",
-            "agent_url": ""
-        }
+        # Parsed config.json and the mtime it was read at
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_mtime: Optional[int] = None
+
+        # Whether the agent directory is known to exist
+        self._dir_ensured = False
+
+        # Default config, built on first use (see create_default_config)
+        self.__config: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def folder_name_for(name: str) -> str:
+        """Folder name an agent with this name lives in, without building an instance."""
+        return name.translate(_UNDERSCORE_TABLE).lower()
 
     # Public properties for controlled access
     @property
@@ -54,19 +121,19 @@ class DataAgent:
 
     def get_config_file(self) -> Path:
         """Get the config file path."""
-        return self._config_file
+        return Path(self._config_file)
 
     def get_notebook_file(self) -> Path:
         """Get the notebook file path."""
-        return self._notebook_file
+        return Path(self._notebook_file)
 
     def get_readme_file(self) -> Path:
         """Get the readme file path."""
-        return self._readme_file
+        return Path(self._readme_file)
 
     def get_testing_file(self) -> Path:
         """Get the testing file path."""
-        return self._testing_file
+        return Path(self._testing_file)
 
     def get_fabric_python_file(self) -> Path:
         """Get the fabric python file path."""
@@ -87,23 +154,64 @@ class DataAgent:
         """Check if agent folder exists."""
         return self._agent_dir.exists()
 
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """Default configuration, built lazily."""
+        return self.create_default_config()
+
+    def _ensure_dir(self) -> None:
+        """Create the agent directory if this instance hasn't already done so."""
+        if not self._dir_ensured:
+            self._agent_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ensured = True
+
     def create_default_config(self) -> Dict[str, Any]:
         """Return the default configuration."""
-        return self._config
+        if self.__config is None:
+            self.__config = {
+                "agent_name": self._name,
+                "folder_name": self._folder_name,
+                "created_date": _now_iso(),
+                "workspace_id": "",
+                "status": "scaffolded",
+                "tenant_id": "",
+                "notebook_id": "",
+                "notebook_name": "",
+                "agent_id": "",
+                "agent_url": ""
+            }
+        return self.__config
 
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file."""
-        self._config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Serialize up front and swap the file in atomically so readers never see a partial write
+        payload = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+        self._ensure_dir()
+        tmp_file = f"{self._config_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, self._config_file)
+        self._config_cache = None
+        self._config_mtime = None
 
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
-        if self._config_file.exists():
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        print("Config file not found")
-        return {}
+        """Load configuration from file, reusing the parsed copy while the file is unchanged."""
+        # A single stat covers the missing, empty and unchanged cases
+        try:
+            stat = os.stat(self._config_file)
+        except FileNotFoundError:
+            print("Config file not found")
+            return {}
+        if stat.st_size == 0:
+            return {}
+        
+        if self._config_cache is None or self._config_mtime != stat.st_mtime_ns:
+            with open(self._config_file, 'rb') as f:
+                self._config_cache = json.loads(f.read())
+            self._config_mtime = stat.st_mtime_ns
+        
+        # Hand out a deep copy so callers can modify it, nested values included, without touching the cache
+        return copy.deepcopy(self._config_cache)
 
     def create(self, force: bool = False) -> None:
         """Create the agent with all its files and directories."""
@@ -113,6 +221,7 @@ class DataAgent:
         
         # Create agent directory (will be created automatically when writing files)
         self._agent_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_ensured = True
         
         # Create config file
         config = self.create_default_config()
@@ -129,7 +238,7 @@ class DataAgent:
                 content = f.read()
 
             content = content.replace("data-agent-name", self._name)
-            self._notebook_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir()
             with open(self._notebook_file, 'w', encoding='utf-8') as f:
                 f.write(content)
 
@@ -143,9 +252,9 @@ class DataAgent:
             
             content = content.replace("{agent_name}", self._name)
             content = content.replace("{folder_name}", self._folder_name)
-            content = content.replace("{created_date}", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            content = content.replace("{created_date}", _now_iso().replace("T", " "))
             
-            self._readme_file.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir()
             with open(self._readme_file, 'w', encoding='utf-8') as f:
                 f.write(content)
 
@@ -153,16 +262,17 @@ class DataAgent:
         """Copy testing template if it exists."""
         template_path = self._get_templates_dir() / "testing_template.ipynb"
         if template_path.exists():
-            self._testing_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(template_path, self._testing_file)
+            self._ensure_dir()
+            shutil.copyfile(template_path, self._testing_file)
 
     def _get_templates_dir(self) -> Path:
         """Get the templates directory."""
-        return Path(__file__).parent.parent / "templates"
+        return _TEMPLATES_DIR
     
 
-    def convert_ipynb_to_fabric_python(self, output_file_path: str = None) -> str:
-        if not self._notebook_file.exists():
+    def convert_ipynb_to_fabric_python(self, output_file_path: str = None) -> int:
+        """Compile the notebook into Fabric Python format and return the bytes written."""
+        if not os.path.exists(self._notebook_file):
             raise FileNotFoundError(f"Notebook file not found: {self._notebook_file}")
         
         # Load config for metadata
@@ -181,119 +291,107 @@ class DataAgent:
         with open(self._notebook_file, "r", encoding="utf-8") as f:
             notebook_data = json.load(f)
         
-        # Start building the Fabric Python content
-        fabric_content = []
-        
-        # Add header
-        fabric_content.append("# Fabric notebook source\n\n")
-        fabric_content.append("# METADATA ********************\n\n")
-        fabric_content.append("# META {\n")
-        fabric_content.append("# META   \"kernel_info\": {\n")
-        fabric_content.append("# META     \"name\": \"synapse_pyspark\"\n")
-        fabric_content.append("# META   }\n")
-        fabric_content.append("# META }\n\n")
-        
-        # Process each cell
-        for cell in notebook_data.get('cells', []):
-            if cell.get("cell_type") == "code":
-                # Check if it's a parameters cell
-                is_param_cell = False
-                try:
-                    tags = cell.get("metadata", {}).get("tags", [])
-                    is_param_cell = "parameters" in tags
-                except:
-                    pass
+        output_path = Path(output_file_path)
+        if output_path.parent == self._agent_dir:
+            self._ensure_dir()
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Stream straight to disk instead of building the whole file in memory, into a temp
+        # file that only replaces the previous output once the whole notebook has converted.
+        # Trailing whitespace is tracked so it can be trimmed to a single newline at the end.
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as out:
+                trailing = 0
                 
-                # Get cell source
-                source_lines = cell.get("source", [])
-                if not source_lines:
-                    continue
+                def write(chunk: bytes) -> None:
+                    nonlocal trailing
+                    out.write(chunk)
+                    stripped = len(chunk.rstrip())
+                    trailing = len(chunk) - stripped if stripped else trailing + len(chunk)
                 
-                first_line = source_lines[0] if source_lines else ""
+                # Add header
+                write(_META_HEADER)
                 
-                # Add cell header
-                if is_param_cell:
-                    fabric_content.append("# PARAMETERS CELL ********************\n\n")
-                else:
-                    fabric_content.append("# CELL ********************\n\n")
+                # Process each cell
+                for cell in notebook_data.get('cells', []):
+                    if cell.get("cell_type") == "code":
+                        # Check if it's a parameters cell
+                        is_param_cell = False
+                        try:
+                            tags = cell.get("metadata", {}).get("tags", [])
+                            is_param_cell = "parameters" in tags
+                        except:
+                            pass
+                        
+                        # Get cell source
+                        source_lines = cell.get("source", [])
+                        if not source_lines:
+                            continue
+                        
+                        first_line = source_lines[0] if source_lines else ""
+                        
+                        # Add cell header
+                        write(_PARAM_HEADER if is_param_cell else _CELL_HEADER)
+                        
+                        # Handle different cell types
+                        if first_line[:1] == "%":
+                            # Magic commands (%%sql runs as Spark SQL, everything else as Python)
+                            language = _MAGIC_LANG.get(first_line.split(maxsplit=1)[0], "python")
+                            write(("# MAGIC " + "# MAGIC ".join(source_lines)).encode("utf-8"))
+                            write(b"\n\n")
+                            self._add_cell_metadata(write, language)
+                            
+                        else:
+                            # Regular Python code
+                            write("".join(source_lines).encode("utf-8"))
+                            write(b"\n\n")
+                            self._add_cell_metadata(write, "python")
+                            
+                    elif cell.get("cell_type") == "markdown":
+                        # Markdown cell
+                        write(_MARKDOWN_HEADER)
+                        markdown_lines = cell.get("source", [])
+                        if markdown_lines:
+                            write(("# " + "# ".join(markdown_lines)).encode("utf-8"))
+                        write(b"\n\n")
                 
-                # Handle different cell types
-                if first_line.startswith("%%sql"):
-                    # SQL cell
-                    for line in source_lines:
-                        fabric_content.append(f"# MAGIC {line}")
-                    fabric_content.append("\n\n")
-                    self._add_cell_metadata(fabric_content, "sparksql")
-                    
-                elif first_line.startswith("%%configure"):
-                    # Configure cell
-                    for line in source_lines:
-                        fabric_content.append(f"# MAGIC {line}")
-                    fabric_content.append("\n\n")
-                    self._add_cell_metadata(fabric_content, "python")
-                    
-                elif first_line.startswith("%%") or first_line.startswith("%"):
-                    # Magic commands
-                    for line in source_lines:
-                        fabric_content.append(f"# MAGIC {line}")
-                    fabric_content.append("\n\n")
-                    self._add_cell_metadata(fabric_content, "python")
-                    
-                else:
-                    # Regular Python code
-                    for line in source_lines:
-                        fabric_content.append(line)
-                    fabric_content.append("\n\n")
-                    self._add_cell_metadata(fabric_content, "python")
-                    
-            elif cell.get("cell_type") == "markdown":
-                # Markdown cell
-                fabric_content.append("# MARKDOWN ********************\n\n")
-                for line in cell.get("source", []):
-                    fabric_content.append(f"# {line}")
-                fabric_content.append("\n\n")
-        
-        # Join all content
-        result = "".join(fabric_content)
-        
-        # Remove trailing newlines and ensure single newline at end
-        result = result.rstrip() + "\n"
-        
-        output_path = Path(output_file_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(result)
-        
-        return result
+                # Remove trailing whitespace and ensure single newline at end
+                out.truncate(out.tell() - trailing)
+                out.seek(0, os.SEEK_END)
+                out.write(b"\n")
+                size = out.tell()
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return size
     
-    def _add_cell_metadata(self, fabric_content: list, language: str = "python") -> None:
+    def _add_cell_metadata(self, write: Callable[[bytes], Any], language: str = "python") -> None:
         """Helper method to add cell metadata."""
-        fabric_content.append("# METADATA ********************\n\n")
-        fabric_content.append("# META {\n")
-        fabric_content.append(f"# META   \"language\": \"{language}\",\n")
-        fabric_content.append("# META   \"language_group\": \"synapse_pyspark\"\n")
-        fabric_content.append("# META }\n\n")
+        write(_META_SQL if language == "sparksql" else _META_PY)
     
-    def upload_to_fabric(self, workspace_id: Optional[str] = None, notebook_name: Optional[str] = None, 
-                        use_ipynb: bool = False, force_update: bool = False, 
-                        ask_before_update: bool = True) -> Dict[str, Any]:
-        # Import here to avoid circular imports
-        from dad_fw.core.fabric_api import FabricAPI
-        
-        # Load agent config
-        config = self.load_config()
-        
-        # Determine workspace ID
-        if workspace_id:
-            target_workspace_id = workspace_id
-        elif config.get("workspace_id"):
-            target_workspace_id = config["workspace_id"]
-        else:
+    def _resolve_workspace_id(self, workspace_id: Optional[str], config: Dict[str, Any]) -> str:
+        """Pick the workspace ID (parameter > agent config) and validate its format."""
+        target_workspace_id = workspace_id or config.get("workspace_id")
+        if not target_workspace_id:
             raise ValueError("No workspace ID provided. Either pass workspace_id parameter or set workspace_id in agent config")
         
         # Validate workspace ID format
         if not FabricAPI.validate_workspace_id(target_workspace_id):
             raise ValueError(f"Invalid workspace ID format: {target_workspace_id}")
+        return target_workspace_id
+    
+    def upload_to_fabric(self, workspace_id: Optional[str] = None, notebook_name: Optional[str] = None, 
+                        use_ipynb: bool = False, force_update: bool = False, 
+                        ask_before_update: bool = True) -> Dict[str, Any]:
+        # Load agent config
+        config = self.load_config()
+        target_workspace_id = self._resolve_workspace_id(workspace_id, config)
         
         # Determine notebook name
         display_name = notebook_name if notebook_name else self._name
@@ -356,12 +454,12 @@ class DataAgent:
             # Create new notebook
             if use_ipynb:
                 # Upload raw .ipynb file
-                if not self._notebook_file.exists():
+                if not os.path.exists(self._notebook_file):
                     raise FileNotFoundError(f"Notebook file not found: {self._notebook_file}")
                 
                 result = FabricAPI.create_notebook_from_ipynb(
                     workspace_id=target_workspace_id,
-                    ipynb_file_path=str(self._notebook_file),
+                    ipynb_file_path=self._notebook_file,
                     notebook_name=display_name
                 )
             else:
@@ -382,7 +480,7 @@ class DataAgent:
         config["status"] = "uploaded"
         config["notebook_name"] = display_name
         config["workspace_id"] = target_workspace_id
-        config["last_upload"] = datetime.now().isoformat()
+        config["last_upload"] = _now_iso()
         
         # Save notebook ID if available in response
         if result and isinstance(result, dict) and "id" in result:
@@ -392,24 +490,11 @@ class DataAgent:
         
         return result
     
-    def run_in_fabric(self, workspace_id: Optional[str] = None) -> Dict[str, Any]:
-        # Import here to avoid circular imports
-        from dad_fw.core.fabric_api import FabricAPI
-        
+    def run_in_fabric(self, workspace_id: Optional[str] = None,
+                      on_status_change: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
         # Load agent config
         config = self.load_config()
-        
-        # Determine workspace ID
-        if workspace_id:
-            target_workspace_id = workspace_id
-        elif config.get("workspace_id"):
-            target_workspace_id = config["workspace_id"]
-        else:
-            raise ValueError("No workspace ID provided. Either pass workspace_id parameter or set workspace_id in agent config")
-        
-        # Validate workspace ID format
-        if not FabricAPI.validate_workspace_id(target_workspace_id):
-            raise ValueError(f"Invalid workspace ID format: {target_workspace_id}")
+        target_workspace_id = self._resolve_workspace_id(workspace_id, config)
         
         # Check if we have notebook info
         notebook_id = config.get("notebook_id")
@@ -422,12 +507,14 @@ class DataAgent:
         if notebook_name:
             result = FabricAPI.run_notebook_by_name(
                 workspace_id=target_workspace_id,
-                notebook_name=notebook_name
+                notebook_name=notebook_name,
+                on_status_change=on_status_change
             )
         elif notebook_id:
             result = FabricAPI.run_notebook_by_id(
                 workspace_id=target_workspace_id,
-                notebook_id=notebook_id
+                notebook_id=notebook_id,
+                on_status_change=on_status_change
             )
         
         # Try to find created data agent after successful execution
@@ -439,20 +526,24 @@ class DataAgent:
                 # List all data agents in workspace
                 agents = FabricAPI.list_data_agents_in_workspace(target_workspace_id)
                 
-                # Look for an agent with name matching our agent
-                matching_agents = []
+                # Look for an agent with name matching our agent (handle underscores/spaces)
+                our_agent_name = self._name.lower()
+                normalized_our_name = our_agent_name.translate(_UNDERSCORE_TABLE)
+                
+                # Index by normalized display name once, keeping the first agent per name
+                agents_by_name = {}
                 for agent in agents:
-                    agent_display_name = agent['displayName'].lower()
-                    our_agent_name = self._name.lower()
-                    
-                    # Check for exact match or close match (handle underscores/spaces)
-                    normalized_agent_name = agent_display_name.replace(' ', '_').replace('-', '_')
-                    normalized_our_name = our_agent_name.replace(' ', '_').replace('-', '_')
-                    
-                    if (normalized_agent_name == normalized_our_name or 
-                        agent_display_name == our_agent_name or 
-                        our_agent_name in agent_display_name):
-                        matching_agents.append(agent)
+                    agents_by_name.setdefault(agent['displayName'].lower().translate(_UNDERSCORE_TABLE), agent)
+                
+                # Exact match first, then fall back to a substring match
+                exact_match = agents_by_name.get(normalized_our_name)
+                if exact_match:
+                    matching_agents = [exact_match]
+                else:
+                    matching_agents = [
+                        agent for agent in agents
+                        if our_agent_name in agent['displayName'].lower()
+                    ]
                 
                 if matching_agents:
                     # Use the first matching agent
@@ -479,7 +570,7 @@ class DataAgent:
             'status': result['status'],
             'success': result['success'],
             'runtime': result['total_runtime_str'],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
         # Update agent info if found
@@ -1,83 +1,197 @@
+from __future__ import annotations
+
 from pathlib import Path
+import asyncio
 import json
-import base64
+import logging
+import binascii
+import functools
+import os
+import random
+import re
+import shutil
 import subprocess
+import threading
 import time
-import requests
-from typing import Dict, Any, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Union
+
+# requests and the Fabric SDK (which pulls in the Azure SDK) are imported on first use,
+# so importing this module for validation or local-only commands stays cheap
+if TYPE_CHECKING:
+    import requests
+    from msfabricpysdkcore import FabricClientCore
+
+# Optional: SIMD-accelerated Base64 for large notebooks (pip install dad-fw[fast])
+try:
+    from pybase64 import b64encode as _fast_b64encode
+except ImportError:
+    _fast_b64encode = None
+
+# Optional: incremental JSON parsing of download results (pip install dad-fw[fast])
+try:
+    import ijson as _ijson
+    _IJSON_ERRORS: tuple = (_ijson.JSONError,)
+except ImportError:
+    _ijson = None
+    _IJSON_ERRORS = ()
+
+# Optional: faster JSON decoding for status polls and tokens (pip install dad-fw[fast]).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so except clauses stay the same.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Canonical UUID (8-4-4-4-12 hex digits), the format of Fabric workspace IDs
+_UUID_RE = re.compile(r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z')
+
+# SDK errors read "<what failed> <HTTP status> <response body>": the first standalone
+# three-digit token is the status; IDs or numbers inside the body don't count
+_HTTP_STATUS_RE = re.compile(r'(?<![\w-])([1-5]\d\d)(?![\w-])')
+
+# Item types that identify data agents / AI skills in a workspace listing
+_AGENT_TYPES: frozenset[str] = frozenset({'DataAgent', 'AISkill', 'Agent'})
+
+# First delay of the polling backoff, in seconds
+_BACKOFF_BASE = 0.5
+
+# Job statuses that mean a notebook run is still queued or running
+_PENDING_JOB_STATUSES = frozenset({'InProgress', 'NotStarted'})
+
+# Notebook definition part constants
+_NOTEBOOK_PART_PATH = 'notebook-content.py'
+_INLINE_BASE64 = 'InlineBase64'
+
+# Base64 characters decoded per write when saving downloaded parts (must be a multiple of 4)
+_B64_DECODE_CHUNK = 1 << 16
+
+# Anything outside the Base64 alphabet (line breaks from wrapped encoders, stray spaces);
+# b64decode ignores these, and removing them keeps chunks on 4-character boundaries
+_B64_NON_ALPHABET_RE = re.compile(r'[^A-Za-z0-9+/=]+')
+
+# Workspace item listings: workspace_id -> (monotonic fetch time, items)
+_ITEMS_CACHE: Dict[str, tuple] = {}
+
+# Seconds to wait for `az account get-access-token` before giving up
+_AZ_TIMEOUT = 30.0
 
-from msfabricpysdkcore import FabricClientCore
+# Azure CLI access tokens: resource -> (token, epoch expiry), shared by concurrent downloads
+_TOKEN_CACHE: Dict[str, tuple] = {}
+_TOKEN_LOCK = threading.Lock()
 
+# Item name index per workspace: workspace_id -> (listing it was built from, {(type, lower name): info})
+_ITEM_INDEX: Dict[str, tuple] = {}
+
+# Last status per download operation: location_url -> (ETag, status result), for conditional polls
+_STATUS_ETAGS: Dict[str, tuple] = {}
+
+
+def _format_runtime(seconds: float) -> str:
+    """Format an elapsed time in seconds as HH:MM:SS."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def _az_executable() -> str:
+    """Resolved path of the Azure CLI; on Windows this finds az.cmd, which a bare "az" would not."""
+    return shutil.which("az") or "az"
+
+
+def _backoff_delay(attempt: int, max_interval: float = 30.0) -> float:
+    """Seconds to wait before poll number `attempt` (0-based): exponential from a low base, capped.
+    
+    +/-20% jitter keeps jobs started together (e.g. run_notebooks_by_id) from polling in lockstep.
+    """
+    return min(max_interval, _BACKOFF_BASE * (1.5 ** attempt)) * random.uniform(0.8, 1.2)
 
 
 class FabricAPI:
+    _fc: Optional[FabricClientCore] = None
+    _fc_lock = threading.Lock()
+
+    @classmethod
+    def _client(cls) -> FabricClientCore:
+        """Process-wide Fabric client so auth and HTTP connections are reused across calls."""
+        if cls._fc is None:
+            # Concurrent runs/downloads call this from worker threads; build the client only once
+            with cls._fc_lock:
+                if cls._fc is None:
+                    from msfabricpysdkcore import FabricClientCore
+                    cls._fc = FabricClientCore()
+        return cls._fc
+
     @staticmethod
-    def create_notebook_from_ipynb(workspace_id: str, ipynb_file_path: str, notebook_name: str) -> Dict[str, Any]:
-        ipynb_path = Path(ipynb_file_path)
-        if not ipynb_path.exists():
-            raise FileNotFoundError(f"Notebook file not found: {ipynb_path}")
-        
-        fc = FabricClientCore()
-        
-        # Read the .ipynb file
-        with open(ipynb_path, 'r', encoding='utf-8') as file:
-            ipynb_content = file.read()
-        
-        # Convert to Base64
-        content_base64 = base64.b64encode(ipynb_content.encode('utf-8')).decode('utf-8')
-        
-        # Package for Fabric API
-        notebook_definition = {
-            'parts': [
-                {
-                    'path': 'notebook-content.py', 
-                    'payload': content_base64, 
-                    'payloadType': 'InlineBase64'
-                }
-            ]
-        }
-        
-        # Create the notebook
-        notebook = fc.create_notebook(
-            workspace_id=workspace_id,
-            definition=notebook_definition,
-            display_name=notebook_name,
-            description="Created from .ipynb file via DAD Framework"
+    @functools.lru_cache(maxsize=1)
+    def _session() -> requests.Session:
+        """Process-wide HTTP session so direct REST calls reuse pooled keep-alive connections."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
         )
-        
-        # Convert notebook object to dictionary for consistent return type
-        return {
-            'id': notebook.id,
-            'display_name': notebook.display_name,
-            'type': getattr(notebook, 'type', 'Notebook'),
-            'workspace_id': workspace_id
-        }
+        session.mount("https://", adapter)
+        return session
+
+    @staticmethod
+    def _b64_of(content: Union[str, bytes]) -> str:
+        """Base64-encode notebook content for an InlineBase64 payload part."""
+        # Content read from disk is already UTF-8 bytes; only encode str input
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        # The payload must be returned as str in the standard alphabet: the SDK sends the
+        # definition with json.dumps (which rejects bytes), and InlineBase64 is not urlsafe.
+        # The ASCII decode is a straight copy, so it is the cheapest possible conversion.
+        if _fast_b64encode is not None:
+            return _fast_b64encode(content).decode('ascii')
+        return binascii.b2a_base64(memoryview(content), newline=False).decode('ascii')
+
+    @staticmethod
+    def _read_file_bytes(file_path: str, description: str) -> bytes:
+        """Read a whole file with one open + fstat instead of exists() followed by open()."""
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{description} not found: {Path(file_path)}") from None
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+            # os.read may return less than asked for; keep reading until EOF
+            while len(data) < size:
+                chunk = os.read(fd, size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return data
+        finally:
+            os.close(fd)
     
     @staticmethod
-    def create_notebook_from_fabric_python(workspace_id: str, fabric_python_content: str, notebook_name: str) -> Dict[str, Any]:
-        fc = FabricClientCore()
-        
-        # Convert to Base64
-        content_base64 = base64.b64encode(fabric_python_content.encode('utf-8')).decode('utf-8')
-        
-        # Package for Fabric API
-        notebook_definition = {
-            'parts': [
-                {
-                    'path': 'notebook-content.py', 
-                    'payload': content_base64, 
-                    'payloadType': 'InlineBase64'
-                }
-            ]
-        }
-        
-        # Create the notebook
-        notebook = fc.create_notebook(
+    def _make_definition(payload_b64: str) -> Dict[str, Any]:
+        """Wrap a Base64 notebook payload in a single-part Fabric item definition."""
+        # Serialization happens inside FabricClientCore (requests' json=), which has no
+        # hook for a custom encoder; the dict is kept minimal so that pass stays cheap.
+        return {'parts': [{'path': _NOTEBOOK_PART_PATH, 'payload': payload_b64, 'payloadType': _INLINE_BASE64}]}
+    
+    @staticmethod
+    def _create_notebook(workspace_id: str, content: Union[str, bytes], notebook_name: str, description: str) -> Dict[str, Any]:
+        """Create a notebook from raw content; the shared path behind the create_notebook_from_* methods."""
+        notebook = FabricAPI._client().create_notebook(
             workspace_id=workspace_id,
-            definition=notebook_definition,
+            definition=FabricAPI._make_definition(FabricAPI._b64_of(content)),
             display_name=notebook_name,
-            description="Created from Fabric Python format via DAD Framework"
+            description=description
         )
+        FabricAPI.invalidate_workspace_cache(workspace_id)
         
         # Convert notebook object to dictionary for consistent return type
         return {
@@ -88,79 +202,112 @@ class FabricAPI:
         }
     
     @staticmethod
-    def create_notebook_from_fabric_python_file(workspace_id: str, fabric_python_file_path: str, notebook_name: str) -> Dict[str, Any]:
-        fabric_path = Path(fabric_python_file_path)
-        if not fabric_path.exists():
-            raise FileNotFoundError(f"Fabric Python file not found: {fabric_path}")
-        
-        # Read the Fabric Python file
-        with open(fabric_path, 'r', encoding='utf-8') as file:
-            fabric_python_content = file.read()
-        
-        return FabricAPI.create_notebook_from_fabric_python(
-            workspace_id=workspace_id,
-            fabric_python_content=fabric_python_content,
-            notebook_name=notebook_name
+    def create_notebook_from_ipynb(workspace_id: str, ipynb_file_path: str, notebook_name: str) -> Dict[str, Any]:
+        # Read the .ipynb file as raw bytes (no decode/re-encode needed for Base64)
+        ipynb_content = FabricAPI._read_file_bytes(ipynb_file_path, "Notebook file")
+        return FabricAPI._create_notebook(
+            workspace_id, ipynb_content, notebook_name, "Created from .ipynb file via DAD Framework"
         )
     
     @staticmethod
-    def find_notebook_by_name(workspace_id: str, notebook_name: str) -> Optional[Dict[str, Any]]:
-        fc = FabricClientCore()
-        
-        # List all items in the workspace
-        items = fc.list_items(workspace_id=workspace_id)
-        
-        # Filter for notebooks with matching name (case-insensitive)
+    def create_notebook_from_fabric_python(workspace_id: str, fabric_python_content: Union[str, bytes], notebook_name: str) -> Dict[str, Any]:
+        return FabricAPI._create_notebook(
+            workspace_id, fabric_python_content, notebook_name, "Created from Fabric Python format via DAD Framework"
+        )
+    
+    @staticmethod
+    def create_notebook_from_fabric_python_file(workspace_id: str, fabric_python_file_path: str, notebook_name: str) -> Dict[str, Any]:
+        # Read the Fabric Python file as raw UTF-8 bytes
+        fabric_python_content = FabricAPI._read_file_bytes(fabric_python_file_path, "Fabric Python file")
+        return FabricAPI.create_notebook_from_fabric_python(workspace_id, fabric_python_content, notebook_name)
+    
+    @staticmethod
+    def _list_items_cached(workspace_id: str, ttl: float = 60.0) -> list:
+        """List workspace items, reusing a listing fetched less than `ttl` seconds ago."""
+        now = time.monotonic()
+        cached = _ITEMS_CACHE.get(workspace_id)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        # One unfiltered listing serves notebook lookups and data agent listing alike
+        items = list(FabricAPI._client().list_items(workspace_id=workspace_id))
+        _ITEMS_CACHE[workspace_id] = (now, items)
+        return items
+    
+    @staticmethod
+    def invalidate_workspace_cache(workspace_id: str) -> None:
+        """Drop the cached listing and name index for a workspace after its items may have changed."""
+        _ITEMS_CACHE.pop(workspace_id, None)
+        _ITEM_INDEX.pop(workspace_id, None)
+    
+    @staticmethod
+    def _index_items(workspace_id: str) -> Dict[tuple, Dict[str, Any]]:
+        """Map (type, lower-cased name) to item info, rebuilt only when the listing is refetched."""
+        items = FabricAPI._list_items_cached(workspace_id)
+        cached = _ITEM_INDEX.get(workspace_id)
+        if cached is not None and cached[0] is items:
+            return cached[1]
+        
+        index: Dict[tuple, Dict[str, Any]] = {}
         for item in items:
-            if (hasattr(item, 'type') and item.type == 'Notebook' and 
-                hasattr(item, 'display_name') and item.display_name.lower() == notebook_name.lower()):
-                return {
-                    'id': item.id,
-                    'display_name': item.display_name,
-                    'type': item.type,
-                    'workspace_id': workspace_id
-                }
-        
-        return None
+            item_type = getattr(item, 'type', None)
+            # Keep the first item for each name, as a linear scan would
+            index.setdefault((item_type, item.display_name.lower()), {
+                'id': item.id,
+                'display_name': item.display_name,
+                'type': item_type,
+                'workspace_id': workspace_id
+            })
+        _ITEM_INDEX[workspace_id] = (items, index)
+        return index
+    
+    @staticmethod
+    def find_notebook_by_name(workspace_id: str, notebook_name: str) -> Optional[Dict[str, Any]]:
+        # Case-insensitive lookup in the per-workspace notebook index
+        return FabricAPI._index_items(workspace_id).get(('Notebook', notebook_name.lower()))
+    
+    @staticmethod
+    def _is_not_found_error(error: Exception) -> bool:
+        """Check whether an SDK/HTTP error reports a missing item (HTTP 404)."""
+        response = getattr(error, 'response', None)
+        status_code = getattr(error, 'status_code', None) or getattr(response, 'status_code', None)
+        if status_code is not None:
+            return status_code == 404
+        match = _HTTP_STATUS_RE.search(str(error))
+        return match is not None and match.group(1) == '404'
     
     @staticmethod
     def get_notebook_by_id(workspace_id: str, notebook_id: str) -> Optional[Dict[str, Any]]:
-        fc = FabricClientCore()
+        fc = FabricAPI._client()
         
         try:
             item = fc.get_item(workspace_id=workspace_id, item_id=notebook_id)
             
-            if hasattr(item, 'type') and item.type == 'Notebook':
+            if getattr(item, 'type', None) == 'Notebook':
                 return {
                     'id': item.id,
                     'display_name': item.display_name,
                     'type': item.type,
                     'workspace_id': workspace_id
                 }
-        except Exception:
-            # Item not found or not accessible
-            pass
+        except Exception as e:
+            # The SDK raises plain Exceptions; only a missing item means "not found",
+            # anything else (auth, throttling, outages) is passed on to the caller
+            if not FabricAPI._is_not_found_error(e):
+                raise
         
         return None
     
     @staticmethod
-    def update_notebook_definition(workspace_id: str, notebook_id: str, fabric_python_content: str) -> bool:
-        fc = FabricClientCore()
+    def update_notebook_definition(workspace_id: str, notebook_id: str, fabric_python_content: Union[str, bytes]) -> bool:
+        fc = FabricAPI._client()
         
         try:
             # Convert to Base64
-            content_base64 = base64.b64encode(fabric_python_content.encode('utf-8')).decode('utf-8')
+            content_base64 = FabricAPI._b64_of(fabric_python_content)
             
             # Package for Fabric API
-            notebook_definition = {
-                'parts': [
-                    {
-                        'path': 'notebook-content.py', 
-                        'payload': content_base64, 
-                        'payloadType': 'InlineBase64'
-                    }
-                ]
-            }
+            notebook_definition = FabricAPI._make_definition(content_base64)
             
             # Update the notebook definition
             response = fc.update_item_definition(
@@ -172,18 +319,13 @@ class FabricAPI:
             return True
             
         except Exception as e:
-            print(f"Error updating notebook: {e}")
+            logger.error("Error updating notebook: %s", e)
             return False
     
     @staticmethod
     def update_notebook_from_fabric_python_file(workspace_id: str, notebook_id: str, fabric_python_file_path: str) -> bool:
-        fabric_path = Path(fabric_python_file_path)
-        if not fabric_path.exists():
-            raise FileNotFoundError(f"Fabric Python file not found: {fabric_path}")
-        
-        # Read the Fabric Python file
-        with open(fabric_path, 'r', encoding='utf-8') as file:
-            fabric_python_content = file.read()
+        # Read the Fabric Python file as raw UTF-8 bytes
+        fabric_python_content = FabricAPI._read_file_bytes(fabric_python_file_path, "Fabric Python file")
         
         return FabricAPI.update_notebook_definition(
             workspace_id=workspace_id,
@@ -192,13 +334,46 @@ class FabricAPI:
         )
     
     @staticmethod
-    def run_notebook_by_id(workspace_id: str, notebook_id: str) -> Dict[str, Any]:
-        import time
+    def _await_job(fc: FabricClientCore, workspace_id: str, item_id: str, job_instance: Any, start_time: float,
+                   on_status_change: Optional[Callable[[Any], None]] = None) -> Any:
+        """Poll a job instance with exponential backoff until it leaves the pending states.
+        
+        on_status_change, if given, is called with the job instance each time its status changes.
+        """
+        # The Fabric job instance endpoint has no long-poll ("Prefer: wait") or webhook
+        # completion, and FabricClientCore doesn't expose per-request headers, so backoff
+        # polling is the cheapest option; this is the single place to change if that appears.
+        attempt = 0
+        status = job_instance.status
+        while status in _PENDING_JOB_STATUSES:
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
+            
+            # Get updated job status (poll quickly again right after a transition)
+            job_instance = fc.get_item_job_instance(
+                workspace_id=workspace_id,
+                item_id=item_id,
+                job_instance_id=job_instance.id
+            )
+            if job_instance.status != status:
+                attempt = 0
+                if on_status_change is not None:
+                    on_status_change(job_instance)
+            status = job_instance.status
+            
+            # Only compute the runtime when the progress line will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Status: %s - Runtime: %s", status, _format_runtime(time.monotonic() - start_time))
         
-        fc = FabricClientCore()
+        return job_instance
+    
+    @staticmethod
+    def run_notebook_by_id(workspace_id: str, notebook_id: str,
+                           on_status_change: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
+        fc = FabricAPI._client()
         
-        print(f"Starting execution of notebook ID: {notebook_id}")
-        start_time = time.time()
+        logger.info("Starting execution of notebook ID: %s", notebook_id)
+        start_time = time.monotonic()
         
         # Enable inline installation for %pip commands
         execution_data = {"_inlineInstallationEnabled": True}
@@ -211,29 +386,16 @@ class FabricAPI:
             execution_data=execution_data
         )
         
-        print(f"Job started with ID: {job_instance.id}")
-        print(f"Initial status: {job_instance.status}")
+        logger.info("Job started with ID: %s", job_instance.id)
+        logger.info("Initial status: %s", job_instance.status)
         
         # Monitor the job until completion
-        while job_instance.status in ["InProgress", "NotStarted"]:
-            time.sleep(10)  # Wait 10 seconds before checking again
-            
-            # Get updated job status
-            job_instance = fc.get_item_job_instance(
-                workspace_id=workspace_id,
-                item_id=notebook_id,
-                job_instance_id=job_instance.id
-            )
-            
-            # Calculate runtime
-            runtime = time.time() - start_time
-            runtime_str = time.strftime("%H:%M:%S", time.gmtime(runtime))
-            
-            print(f"Status: {job_instance.status} - Runtime: {runtime_str}")
+        job_instance = FabricAPI._await_job(fc, workspace_id, notebook_id, job_instance, start_time, on_status_change)
+        FabricAPI.invalidate_workspace_cache(workspace_id)
         
         # Final status
-        total_runtime = time.time() - start_time
-        total_runtime_str = time.strftime("%H:%M:%S", time.gmtime(total_runtime))
+        total_runtime = time.monotonic() - start_time
+        total_runtime_str = _format_runtime(total_runtime)
         
         result = {
             'notebook_id': notebook_id,
@@ -245,34 +407,33 @@ class FabricAPI:
         }
         
         if job_instance.status == "Completed":
-            print(f"Notebook execution completed successfully!")
-            print(f"Total runtime: {total_runtime_str}")
+            logger.info("Notebook execution completed successfully!")
+            logger.info("Total runtime: %s", total_runtime_str)
         elif job_instance.status == "Failed":
-            print(f"Notebook execution failed!")
-            print(f"Runtime before failure: {total_runtime_str}")
-            print(job_instance)
+            logger.error("Notebook %s execution failed!", notebook_id)
+            logger.error("Runtime before failure: %s", total_runtime_str)
+            logger.error("%s", job_instance)
         else:
-            print(f"Notebook execution ended with status: {job_instance.status}")
-            print(f"Total runtime: {total_runtime_str}")
+            logger.info("Notebook execution ended with status: %s", job_instance.status)
+            logger.info("Total runtime: %s", total_runtime_str)
 
         return result
     
     @staticmethod
-    def run_notebook_by_name(workspace_id: str, notebook_name: str) -> Dict[str, Any]:
+    def run_notebook_by_name(workspace_id: str, notebook_name: str,
+                             on_status_change: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
         # Find the notebook first
         notebook_info = FabricAPI.find_notebook_by_name(workspace_id, notebook_name)
         if not notebook_info:
             raise ValueError(f"Notebook '{notebook_name}' not found in workspace {workspace_id}")
         
         notebook_id = notebook_info['id']
-        print(f"Found notebook: {notebook_name} (ID: {notebook_id})")
-        
-        import time
+        logger.info("Found notebook: %s (ID: %s)", notebook_name, notebook_id)
         
-        fc = FabricClientCore()
+        fc = FabricAPI._client()
         
-        print(f"Starting execution of '{notebook_name}'...")
-        start_time = time.time()
+        logger.info("Starting execution of '%s'...", notebook_name)
+        start_time = time.monotonic()
         
         # Enable inline installation for %pip commands
         execution_data = {"_inlineInstallationEnabled": True}
@@ -285,29 +446,16 @@ class FabricAPI:
             execution_data=execution_data
         )
         
-        print(f"Job started with ID: {job_instance.id}")
-        print(f"Initial status: {job_instance.status}")
+        logger.info("Job started with ID: %s", job_instance.id)
+        logger.info("Initial status: %s", job_instance.status)
         
         # Monitor the job until completion
-        while job_instance.status in ["InProgress", "NotStarted"]:
-            time.sleep(10)  # Wait 10 seconds before checking again
-            
-            # Get updated job status
-            job_instance = fc.get_item_job_instance(
-                workspace_id=workspace_id,
-                item_id=notebook_id,
-                job_instance_id=job_instance.id
-            )
-            
-            # Calculate runtime
-            runtime = time.time() - start_time
-            runtime_str = time.strftime("%H:%M:%S", time.gmtime(runtime))
-            
-            print(f"Status: {job_instance.status} - Runtime: {runtime_str}")
+        job_instance = FabricAPI._await_job(fc, workspace_id, notebook_id, job_instance, start_time, on_status_change)
+        FabricAPI.invalidate_workspace_cache(workspace_id)
         
         # Final status
-        total_runtime = time.time() - start_time
-        total_runtime_str = time.strftime("%H:%M:%S", time.gmtime(total_runtime))
+        total_runtime = time.monotonic() - start_time
+        total_runtime_str = _format_runtime(total_runtime)
         
         result = {
             'notebook_name': notebook_name,
@@ -320,88 +468,160 @@ class FabricAPI:
         }
         
         if job_instance.status == "Completed":
-            print(f"Notebook execution completed successfully!")
-            print(f"Total runtime: {total_runtime_str}")
+            logger.info("Notebook execution completed successfully!")
+            logger.info("Total runtime: %s", total_runtime_str)
         elif job_instance.status == "Failed":
-            print(f"Notebook execution failed!")
-            print(f"Runtime before failure: {total_runtime_str}")
-            print(job_instance)
+            logger.error("Notebook '%s' execution failed!", notebook_name)
+            logger.error("Runtime before failure: %s", total_runtime_str)
+            logger.error("%s", job_instance)
         else:
-            print(f"Notebook execution ended with status: {job_instance.status}")
-            print(f"Total runtime: {total_runtime_str}")
+            logger.info("Notebook execution ended with status: %s", job_instance.status)
+            logger.info("Total runtime: %s", total_runtime_str)
 
         return result
     
+    @staticmethod
+    async def _run_notebook_async(workspace_id: str, notebook_id: str,
+                                  on_status_change: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
+        """Run one notebook without blocking the event loop (SDK calls run in worker threads)."""
+        fc = FabricAPI._client()
+        start_time = time.monotonic()
+        
+        # Start the notebook execution (inline installation enabled for %pip commands)
+        job_instance = await asyncio.to_thread(
+            fc.run_on_demand_item_job,
+            workspace_id=workspace_id,
+            item_id=notebook_id,
+            job_type="RunNotebook",
+            execution_data={"_inlineInstallationEnabled": True}
+        )
+        logger.info("[%s] Job started with ID: %s", notebook_id, job_instance.id)
+        
+        # Poll with the same backoff as _await_job, yielding to other runs while waiting
+        attempt = 0
+        status = job_instance.status
+        while status in _PENDING_JOB_STATUSES:
+            await asyncio.sleep(_backoff_delay(attempt))
+            attempt += 1
+            job_instance = await asyncio.to_thread(
+                fc.get_item_job_instance,
+                workspace_id=workspace_id,
+                item_id=notebook_id,
+                job_instance_id=job_instance.id
+            )
+            if job_instance.status != status:
+                attempt = 0
+                if on_status_change is not None:
+                    on_status_change(job_instance)
+            status = job_instance.status
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] Status: %s - Runtime: %s", notebook_id, status, _format_runtime(time.monotonic() - start_time))
+        
+        FabricAPI.invalidate_workspace_cache(workspace_id)
+        total_runtime = time.monotonic() - start_time
+        return {
+            'notebook_id': notebook_id,
+            'job_id': job_instance.id,
+            'status': job_instance.status,
+            'total_runtime': total_runtime,
+            'total_runtime_str': _format_runtime(total_runtime),
+            'success': job_instance.status == "Completed"
+        }
+    
+    @staticmethod
+    async def run_notebooks_async(workspace_id: str, notebook_ids: List[str],
+                                  on_status_change: Optional[Callable[[Any], None]] = None) -> List[Dict[str, Any]]:
+        """Run several notebooks concurrently and wait for all of them to finish."""
+        return await asyncio.gather(
+            *(FabricAPI._run_notebook_async(workspace_id, notebook_id, on_status_change) for notebook_id in notebook_ids)
+        )
+    
+    @staticmethod
+    def run_notebooks_by_id(workspace_id: str, notebook_ids: List[str],
+                            on_status_change: Optional[Callable[[Any], None]] = None) -> List[Dict[str, Any]]:
+        """Blocking wrapper around run_notebooks_async; results are in the order of notebook_ids."""
+        return asyncio.run(FabricAPI.run_notebooks_async(workspace_id, notebook_ids, on_status_change))
+    
     @staticmethod
     def list_data_agents_in_workspace(workspace_id: str) -> list:
-        fc = FabricClientCore()
-        
         try:
             # Note: This assumes there's a method to list AI skills/agents
             # The exact API method may vary - this is based on the upload.py reference
-            items = fc.list_items(workspace_id=workspace_id)
+            items = FabricAPI._list_items_cached(workspace_id)
             
-            # Filter for data agents/AI skills (type might be different)
-            agents = []
-            for item in items:
-                # The exact type name may need adjustment based on actual Fabric API
-                if hasattr(item, 'type') and item.type in ['DataAgent', 'AISkill', 'Agent']:
-                    agents.append({
-                        'id': item.id,
-                        'displayName': item.display_name,
-                        'type': item.type
-                    })
-            
-            return agents
+            # Filter for data agents/AI skills (the exact type names are in _AGENT_TYPES)
+            return [
+                {'id': item.id, 'displayName': item.display_name, 'type': item.type}
+                for item in items if getattr(item, 'type', None) in _AGENT_TYPES
+            ]
             
         except Exception as e:
-            print(f"Error listing data agents: {e}")
+            logger.error("Error listing data agents: %s", e)
             return []
     
     @staticmethod
     def validate_workspace_id(workspace_id: str) -> bool:
-        if not workspace_id or not isinstance(workspace_id, str):
-            return False
-        
-        # Basic UUID format check (Fabric workspace IDs are typically UUIDs)
-        if len(workspace_id) == 36 and workspace_id.count('-') == 4:
-            return True
-        
-        return False
+        # Fabric workspace IDs are UUIDs in the canonical 8-4-4-4-12 hex form
+        return isinstance(workspace_id, str) and _UUID_RE.match(workspace_id) is not None
 
     @staticmethod
     def _get_bearer_token() -> str:
+        # Reuse the token until shortly before it expires; `az` takes around a second per call
+        with _TOKEN_LOCK:
+            cached = _TOKEN_CACHE.get("fabric")
+            if cached is not None and time.time() < cached[1] - 60:
+                return cached[0]
+            
+            try:
+                # Exec az directly rather than through a shell
+                result = subprocess.run(
+                    [_az_executable(), "account", "get-access-token", "--resource", "https://api.fabric.microsoft.com"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    # Never wait on an interactive prompt, and don't let a wedged CLI hang the caller
+                    stdin=subprocess.DEVNULL,
+                    timeout=_AZ_TIMEOUT
+                )
+                token_data = _json_loads(result.stdout)
+                access_token = token_data["accessToken"]
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Failed to get Azure token. Make sure you're logged in with 'az login'. Error: {e.stderr}")
+            except (json.JSONDecodeError, KeyError) as e:
+                raise RuntimeError(f"Failed to parse token response: {e}")
+            except FileNotFoundError:
+                raise RuntimeError("Azure CLI not found. Please install Azure CLI and run 'az login'")
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"Azure CLI did not return a token within {_AZ_TIMEOUT:g} seconds")
+            
+            _TOKEN_CACHE["fabric"] = (access_token, FabricAPI._token_expiry(token_data))
+            return access_token
+
+    @staticmethod
+    def _token_expiry(token_data: Dict[str, Any]) -> float:
+        """Epoch expiry of an `az account get-access-token` response (0 if it can't be read)."""
+        # Newer CLI versions report epoch seconds; older ones only a local-time string
+        if token_data.get("expires_on"):
+            try:
+                return float(token_data["expires_on"])
+            except (TypeError, ValueError):
+                pass
         try:
-            result = subprocess.run(
-                "az account get-access-token --resource https://api.fabric.microsoft.com",
-                capture_output=True,
-                text=True,
-                check=True,
-                shell=True
-            )
-            token_data = json.loads(result.stdout)
-            return token_data["accessToken"]
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get Azure token. Make sure you're logged in with 'az login'. Error: {e.stderr}")
-        except (json.JSONDecodeError, KeyError) as e:
-            raise RuntimeError(f"Failed to parse token response: {e}")
-        except FileNotFoundError:
-            raise RuntimeError("Azure CLI not found. Please install Azure CLI and run 'az login'")
+            return datetime.fromisoformat(token_data["expiresOn"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return 0.0
 
     @staticmethod
-    def _request_notebook_download(workspace_id: str, notebook_id: str, access_token: str, 
+    def _request_notebook_download(workspace_id: str, notebook_id: str, headers: Dict[str, str], 
                                    as_ipynb: bool = True, verify_ssl: bool = False) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+        import requests
         
         url = f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id}/notebooks/{notebook_id}/getDefinition"
         if as_ipynb:
             url += "?format=ipynb"
         
         try:
-            resp = requests.post(url, headers=headers, verify=verify_ssl)
+            resp = FabricAPI._session().post(url, headers=headers, verify=verify_ssl)
             
             if resp.status_code == 202:
                 location = resp.headers.get("Location")
@@ -435,34 +655,46 @@ class FabricAPI:
             }
 
     @staticmethod
-    def _check_download_status(location_url: str, access_token: str, verify_ssl: bool = False) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+    def _check_download_status(location_url: str, headers: Dict[str, str], verify_ssl: bool = False) -> Dict[str, Any]:
+        import requests
+        
+        # Ask for the status only if it changed since the last poll
+        previous = _STATUS_ETAGS.get(location_url)
+        if previous is not None:
+            # Copy so the caller's shared headers stay unconditional
+            headers = {**headers, "If-None-Match": previous[0]}
         
         try:
-            resp = requests.get(location_url, headers=headers, verify=verify_ssl)
+            resp = FabricAPI._session().get(location_url, headers=headers, verify=verify_ssl)
             
-            if resp.status_code == 200:
-                data = resp.json()
+            if resp.status_code == 304 and previous is not None:
+                return previous[1]
+            elif resp.status_code == 200:
+                data = _json_loads(resp.content)
                 status = data.get("status", "Unknown")
                 percent = data.get("percentComplete", 0)
                 
                 if status == "Failed":
                     error_info = data.get("error", "Unknown error")
-                    return {
+                    result = {
                         "success": True,
                         "status": status,
                         "percent_complete": percent,
                         "error": f"Operation failed: {error_info}"
                     }
+                else:
+                    result = {
+                        "success": True,
+                        "status": status,
+                        "percent_complete": percent
+                    }
                 
-                return {
-                    "success": True,
-                    "status": status,
-                    "percent_complete": percent
-                }
+                etag = resp.headers.get("ETag")
+                if etag and status not in ("Succeeded", "Failed"):
+                    _STATUS_ETAGS[location_url] = (etag, result)
+                else:
+                    _STATUS_ETAGS.pop(location_url, None)
+                return result
             elif resp.status_code == 202:
                 return {
                     "success": True,
@@ -481,23 +713,32 @@ class FabricAPI:
                 "status": "Error",
                 "error": f"Request failed: {str(e)}"
             }
+        except ValueError as e:
+            # Malformed JSON body (resp.json() used to surface this as a RequestException)
+            return {
+                "success": False,
+                "status": "Error",
+                "error": f"Invalid response body: {str(e)}"
+            }
 
     @staticmethod
-    def _get_download_result(location_url: str, access_token: str, verify_ssl: bool = False) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+    def _get_download_result(location_url: str, headers: Dict[str, str], verify_ssl: bool = False) -> Dict[str, Any]:
+        import requests
+        from urllib3.exceptions import HTTPError as Urllib3Error
         
         result_url = location_url.rstrip('/') + '/result'
         
         try:
-            resp = requests.get(result_url, headers=headers, verify=verify_ssl)
+            resp = FabricAPI._session().get(result_url, headers=headers, verify=verify_ssl, stream=True)
             
             if resp.status_code == 200:
-                data = resp.json()
-                definition = data.get("definition", {})
-                parts = definition.get("parts", [])
+                with resp:
+                    if _ijson is not None:
+                        # Parse parts straight off the socket instead of buffering the whole body first
+                        resp.raw.decode_content = True
+                        parts = list(_ijson.items(resp.raw, 'definition.parts.item'))
+                    else:
+                        parts = _json_loads(resp.content).get("definition", {}).get("parts", [])
                 
                 if not parts:
                     return {
@@ -520,12 +761,44 @@ class FabricAPI:
                     "success": False,
                     "error": f"HTTP {resp.status_code}: {error_msg}"
                 }
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, Urllib3Error) as e:
+            # Reading resp.raw directly (ijson path) surfaces urllib3's errors unwrapped,
+            # e.g. ProtocolError on a connection reset or ReadTimeoutError mid-body
             return {
                 "success": False,
                 "error": f"Request failed: {str(e)}"
             }
+        except (ValueError, *_IJSON_ERRORS) as e:
+            # Truncated or malformed body (resp.json() used to surface this as a RequestException)
+            return {
+                "success": False,
+                "error": f"Invalid response body: {str(e)}"
+            }
 
+    @staticmethod
+    def _write_b64_payload(payload: str, file_path: Path) -> None:
+        """Decode a Base64 payload into a file in fixed-size chunks, never holding the decoded whole.
+        
+        The target is only replaced once the whole payload has decoded; binascii.Error
+        from a bad payload propagates with the existing file untouched.
+        """
+        if _B64_NON_ALPHABET_RE.search(payload):
+            payload = _B64_NON_ALPHABET_RE.sub('', payload)
+        
+        tmp_path = f"{file_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                # Chunks are a multiple of 4 characters, so each one decodes independently
+                for start in range(0, len(payload), _B64_DECODE_CHUNK):
+                    f.write(binascii.a2b_base64(payload[start:start + _B64_DECODE_CHUNK]))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     @staticmethod
     def download_notebook_by_id(workspace_id: str, notebook_id: str, data_agent_name: Optional[str] = None,
                                output_dir: str = "./downloaded_notebooks", timeout: int = 300, 
@@ -544,9 +817,15 @@ class FabricAPI:
                 "elapsed_time": time.time() - start_time
             }
         
+        # Built once and shared by every request of this download
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+        
         # Step 2: Request notebook download
         request_result = FabricAPI._request_notebook_download(
-            workspace_id, notebook_id, access_token, as_ipynb, verify_ssl
+            workspace_id, notebook_id, headers, as_ipynb, verify_ssl
         )
         
         if not request_result["success"]:
@@ -558,46 +837,60 @@ class FabricAPI:
         
         location_url = request_result["location"]
         
-        # Step 3: Poll for completion
-        poll_start = time.time()
-        first_check = True
-        
-        while True:
-            elapsed = time.time() - poll_start
-            
-            if elapsed > timeout:
-                return {
-                    "success": False,
-                    "error": f"Operation timed out after {timeout} seconds",
-                    "elapsed_time": time.time() - start_time
-                }
-            
-            if not first_check:
-                time.sleep(poll_interval)
-            first_check = False
-            
-            status_result = FabricAPI._check_download_status(location_url, access_token, verify_ssl)
-            
-            if not status_result["success"]:
-                return {
-                    "success": False,
-                    "error": status_result.get("error", "Failed to check status"),
-                    "elapsed_time": time.time() - start_time
-                }
-            
-            status = status_result["status"]
+        # Step 3: Poll for completion (backoff capped at poll_interval, reset on status changes)
+        # The ETag kept for conditional polls is dropped however the loop ends (timeout, error, exception)
+        try:
+            poll_start = time.time()
+            first_check = True
+            attempt = 0
+            last_status = None
+            percent_complete = 0
             
-            if status == "Succeeded":
-                break
-            elif status == "Failed":
-                return {
-                    "success": False,
-                    "error": status_result.get("error", "Operation failed"),
-                    "elapsed_time": time.time() - start_time
-                }
+            while True:
+                elapsed = time.time() - poll_start
+                
+                if elapsed > timeout:
+                    return {
+                        "success": False,
+                        "error": f"Operation timed out after {timeout} seconds",
+                        "elapsed_time": time.time() - start_time
+                    }
+                
+                if not first_check:
+                    delay = _backoff_delay(attempt, max_interval=poll_interval)
+                    # Close to done: check back sooner
+                    time.sleep(max(_BACKOFF_BASE, delay * (100 - percent_complete) / 100))
+                    attempt += 1
+                first_check = False
+                
+                status_result = FabricAPI._check_download_status(location_url, headers, verify_ssl)
+                
+                if not status_result["success"]:
+                    return {
+                        "success": False,
+                        "error": status_result.get("error", "Failed to check status"),
+                        "elapsed_time": time.time() - start_time
+                    }
+                
+                status = status_result["status"]
+                percent_complete = min(max(status_result.get("percent_complete") or 0, 0), 100)
+                if status != last_status:
+                    attempt = 0
+                    last_status = status
+                
+                if status == "Succeeded":
+                    break
+                elif status == "Failed":
+                    return {
+                        "success": False,
+                        "error": status_result.get("error", "Operation failed"),
+                        "elapsed_time": time.time() - start_time
+                    }
+        finally:
+            _STATUS_ETAGS.pop(location_url, None)
         
         # Step 4: Get the response
-        response_result = FabricAPI._get_download_result(location_url, access_token, verify_ssl)
+        response_result = FabricAPI._get_download_result(location_url, headers, verify_ssl)
         
         if not response_result["success"]:
             return {
@@ -625,16 +918,8 @@ class FabricAPI:
                 "elapsed_time": time.time() - start_time
             }
         
-        # Decode the notebook content
-        try:
-            payload = ipynb_part.get("payload", "")
-            decoded_bytes = base64.b64decode(payload)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Failed to decode notebook: {str(e)}",
-                "elapsed_time": time.time() - start_time
-            }
+        # The notebook content is decoded straight into the target file below
+        payload = ipynb_part.get("payload", "")
         
         # Determine where to write the file
         if data_agent_name:
@@ -649,8 +934,14 @@ class FabricAPI:
                     }
                 
                 notebook_file = agent.get_notebook_file()
-                notebook_file.write_bytes(decoded_bytes)
+                FabricAPI._write_b64_payload(payload, notebook_file)
                 written_files = [str(notebook_file)]
+            except binascii.Error as e:
+                return {
+                    "success": False,
+                    "error": f"Failed to decode notebook: {str(e)}",
+                    "elapsed_time": time.time() - start_time
+                }
             except Exception as e:
                 return {
                     "success": False,
@@ -663,16 +954,20 @@ class FabricAPI:
                 output_path = Path(output_dir)
                 output_path.mkdir(parents=True, exist_ok=True)
                 file_path = output_path / ipynb_part.get("path", "notebook.ipynb")
-                file_path.write_bytes(decoded_bytes)
+                FabricAPI._write_b64_payload(payload, file_path)
                 written_files = [str(file_path)]
                 
                 # Decode and save .platform file for debugging
                 if platform_part:
-                    platform_payload = platform_part.get("payload", "")
-                    platform_decoded = base64.b64decode(platform_payload)
                     platform_file = output_path / ".platform"
-                    platform_file.write_bytes(platform_decoded)
+                    FabricAPI._write_b64_payload(platform_part.get("payload", ""), platform_file)
                     written_files.append(str(platform_file))
+            except binascii.Error as e:
+                return {
+                    "success": False,
+                    "error": f"Failed to decode notebook: {str(e)}",
+                    "elapsed_time": time.time() - start_time
+                }
             except Exception as e:
                 return {
                     "success": False,
@@ -710,4 +1005,40 @@ class FabricAPI:
             poll_interval=poll_interval,
             as_ipynb=as_ipynb,
             verify_ssl=verify_ssl
-        )
\ No newline at end of file
+        )
+    @staticmethod
+    async def download_notebooks_async(workspace_id: str, notebook_ids: List[str],
+                                       output_dir: str = "./downloaded_notebooks", timeout: int = 300,
+                                       poll_interval: int = 5, as_ipynb: bool = True,
+                                       verify_ssl: bool = False) -> List[Dict[str, Any]]:
+        """Download several notebooks concurrently, each into its own <output_dir>/<notebook_id> folder."""
+        # Each download runs in a worker thread; all of them share the pooled HTTP session.
+        # One failed download must not discard the others' results.
+        results = await asyncio.gather(*(
+            asyncio.to_thread(
+                FabricAPI.download_notebook_by_id,
+                workspace_id=workspace_id,
+                notebook_id=notebook_id,
+                output_dir=str(Path(output_dir) / notebook_id),
+                timeout=timeout,
+                poll_interval=poll_interval,
+                as_ipynb=as_ipynb,
+                verify_ssl=verify_ssl
+            )
+            for notebook_id in notebook_ids
+        ), return_exceptions=True)
+        return [
+            {"success": False, "error": f"Download failed: {str(result)}"}
+            if isinstance(result, Exception) else result
+            for result in results
+        ]
+
+    @staticmethod
+    def download_notebooks_bulk(workspace_id: str, notebook_ids: List[str],
+                                output_dir: str = "./downloaded_notebooks", timeout: int = 300,
+                                poll_interval: int = 5, as_ipynb: bool = True,
+                                verify_ssl: bool = False) -> List[Dict[str, Any]]:
+        """Blocking wrapper around download_notebooks_async; results are in the order of notebook_ids."""
+        return asyncio.run(FabricAPI.download_notebooks_async(
+            workspace_id, notebook_ids, output_dir, timeout, poll_interval, as_ipynb, verify_ssl
+        ))
@@ -2,11 +2,62 @@
 Strictly stateless FrameworkUtils for robust CLI and pipeline usage.
 Each method is self-contained with no persistent state.
 """
+import json
+import os
 from pathlib import Path
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from .data_agent import DataAgent
 
+# Agent folders above which config.json reads are spread over threads, and how many
+_PARALLEL_STAT_MIN = 32
+_STAT_WORKERS = 32
+
+
+def _compile_agent(agent: DataAgent, output_file_path: Optional[str]) -> Tuple[dict, str]:
+    """Compile one agent and return its result with the line to report."""
+    try:
+        # Check if notebook exists
+        notebook_file = agent.get_notebook_file()
+        if not notebook_file.exists():
+            error = f"Notebook file not found: {notebook_file}"
+            return {'agent': agent.name, 'success': False, 'error': error}, f"[red]  ✗ {error}[/red]"
+        
+        if output_file_path:
+            agent.set_fabric_python_file(output_file_path)
+        
+        # Convert notebook; the converter reports the size it wrote, so no stat is needed
+        file_size = agent.convert_ipynb_to_fabric_python(output_file_path=output_file_path)
+        output_file = agent.get_fabric_python_file()
+        
+        result = {
+            'agent': agent.name,
+            'success': True,
+            'output_file': str(output_file),
+            'file_size': file_size
+        }
+        return result, f"[green]  ✓ Compiled to: {output_file} ({file_size:,} bytes)[/green]"
+        
+    except Exception as e:
+        return {'agent': agent.name, 'success': False, 'error': str(e)}, f"[red]  ✗ Failed: {e}[/red]"
+
+
+def _read_agent_name(config_path: str) -> Optional[str]:
+    """Agent name stored in a config.json: None if the file is missing, "" if it has no usable name."""
+    try:
+        with open(config_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        return ""
+    try:
+        agent_name = json.loads(data).get("agent_name")
+    except (ValueError, AttributeError):
+        return ""
+    return agent_name if isinstance(agent_name, str) else ""
+
 
 class FrameworkUtils:
     """Stateless utilities for managing data agents."""
@@ -27,19 +78,47 @@ class FrameworkUtils:
     @staticmethod
     def list_agents(base_dir: Path) -> List[DataAgent]:
         """List all existing agents in the specified directory."""
-        if not base_dir.exists() or not base_dir.is_dir():
+        return [DataAgent(agent_name, base_dir) for agent_name in FrameworkUtils._scan_agent_names(base_dir)]
+    
+    @staticmethod
+    def _scan_agent_names(base_dir: Path) -> List[str]:
+        """Names of the agent folders (with a config.json) directly under base_dir."""
+        try:
+            entries = os.scandir(base_dir)
+        except (FileNotFoundError, NotADirectoryError):
             return []
         
-        agents = []
-        for item in base_dir.iterdir():
-            if item.is_dir() and (item / "config.json").exists():
-                # Try to create agent from folder name
-                agent_name = item.name.replace("_", " ").title()
-                agent = DataAgent(agent_name, base_dir)
-                if agent.exists():  # Double-check it's valid
-                    agents.append(agent)
-        return agents
-
+        candidates = []
+        with entries:
+            for entry in entries:
+                # DirEntry.is_dir reuses the readdir result, so only config.json needs a read
+                if not entry.is_dir():
+                    continue
+                # Fallback name derived from the folder (lossy: "iphone_app" -> "Iphone App")
+                folder_agent_name = entry.name.replace("_", " ").title()
+                # Folder must round-trip through the name (string check, so done before any I/O)
+                if DataAgent.folder_name_for(folder_agent_name) == entry.name:
+                    candidates.append((entry.name, folder_agent_name, os.path.join(entry.path, "config.json")))
+        
+        config_paths = [config_path for _, _, config_path in candidates]
+        if len(config_paths) > _PARALLEL_STAT_MIN:
+            # On network shares each read is a round trip; overlap them (file I/O releases the GIL)
+            with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as pool:
+                config_names = list(pool.map(_read_agent_name, config_paths))
+        else:
+            config_names = [_read_agent_name(config_path) for config_path in config_paths]
+        
+        agent_names = []
+        for (folder_name, folder_agent_name, _), config_name in zip(candidates, config_names):
+            if config_name is None:
+                continue
+            # Prefer the name the agent was created with, as long as it still maps to this folder
+            if config_name and DataAgent.folder_name_for(config_name) == folder_name:
+                agent_names.append(config_name)
+            else:
+                agent_names.append(folder_agent_name)
+        return agent_names
+    
     @staticmethod
     def get_all_agents(base_dir: Path) -> List[DataAgent]:
         """Get all agents in the workspace. Alias for list_agents for cleaner code."""
@@ -71,53 +150,24 @@ class FrameworkUtils:
             return []
         
         rprint(f"[cyan]Found {len(agents)} agents to compile[/cyan]")
-        results = []
         
+        # The output directory is the same for every agent, so resolve it once
+        output_dir = custom_output_dir.resolve() if custom_output_dir else None
+        
+        results = []
+        # Serial on purpose: each conversion takes milliseconds, far less than starting workers
         for agent in agents:
-            try:
-                rprint(f"\n[blue]Compiling: {agent.name}[/blue]")
-                
-                # Check if notebook exists
-                if not agent.get_notebook_file().exists():
-                    result = {
-                        'agent': agent.name,
-                        'success': False,
-                        'error': f"Notebook file not found: {agent.get_notebook_file()}"
-                    }
-                    rprint(f"[red]  ✗ {result['error']}[/red]")
-                    results.append(result)
-                    continue
-                
-                # Build output path if custom directory is provided
-                output_file_path = None
-                if custom_output_dir:
-                    output_dir = custom_output_dir.resolve()
-                    filename = f"{agent.folder_name}{output_name_suffix}.py"
-                    output_file_path = str(output_dir / filename)
-                    agent.set_fabric_python_file(output_file_path)
-                
-                # Convert notebook
-                agent.convert_ipynb_to_fabric_python(output_file_path=output_file_path)
-                output_file = agent.get_fabric_python_file()
-                file_size = output_file.stat().st_size
-                
-                result = {
-                    'agent': agent.name,
-                    'success': True,
-                    'output_file': str(output_file),
-                    'file_size': file_size
-                }
-                rprint(f"[green]  ✓ Compiled to: {output_file} ({file_size:,} bytes)[/green]")
-                results.append(result)
-                
-            except Exception as e:
-                result = {
-                    'agent': agent.name,
-                    'success': False,
-                    'error': str(e)
-                }
-                rprint(f"[red]  ✗ Failed: {e}[/red]")
-                results.append(result)
+            rprint(f"\n[blue]Compiling: {agent.name}[/blue]")
+            
+            # Build output path if custom directory is provided
+            output_file_path = None
+            if output_dir is not None:
+                output_file_path = os.path.join(output_dir, f"{agent.folder_name}{output_name_suffix}.py")
+            
+            # Failures are reported per agent and don't stop the batch
+            result, message = _compile_agent(agent, output_file_path)
+            rprint(message)
+            results.append(result)
         
         return results
     
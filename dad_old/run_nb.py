@@ -1,5 +1,67 @@
 from msfabricpysdkcore import FabricClientCore
+import asyncio
+import random
+import threading
 import time
+from rich.console import Console
+from rich.live import Live
+
+# Job statuses that mean the run hasn't finished yet
+PENDING_STATUSES = frozenset(("InProgress", "NotStarted"))
+
+# Job status polling: exponential backoff from POLL_BASE seconds, capped at POLL_CAP
+POLL_BASE = 2.0
+POLL_CAP = 60.0
+
+console = Console()
+
+# Shared Fabric client, created on first use
+_FC = None
+_FC_LOCK = threading.Lock()
+
+def _get_client():
+    """
+    Get the process-wide Fabric client.
+    
+    Returns:
+        FabricClientCore: One client reused by every call, keeping its token and connections
+    """
+    global _FC
+    if _FC is None:
+        with _FC_LOCK:
+            if _FC is None:
+                _FC = FabricClientCore()
+    return _FC
+
+def _poll_sleep(attempt):
+    """
+    Seconds to wait before the next job status poll.
+    
+    Args:
+        attempt: Number of polls made since the last status change
+        
+    Returns:
+        float: Backoff delay with +/-20% jitter so concurrent pollers drift apart
+    """
+    return min(POLL_CAP, POLL_BASE * 2 ** attempt) * random.uniform(0.8, 1.2)
+
+def _find_notebook(fc, workspace_id, notebook_name):
+    """
+    Find a notebook in a workspace by its display name.
+    
+    Args:
+        fc: Fabric client
+        workspace_id: The Fabric workspace ID
+        notebook_name: The display name of the notebook
+        
+    Returns:
+        The notebook item, or None if not found
+    """
+    # list_notebooks only returns notebooks, so no other item types are fetched or filtered
+    for notebook in fc.list_notebooks(workspace_id):
+        if notebook.display_name == notebook_name:
+            return notebook
+    return None
 
 def run_notebook_by_name(workspace_id, notebook_name):
     """
@@ -12,21 +74,10 @@ def run_notebook_by_name(workspace_id, notebook_name):
     Returns:
         dict: Job execution results with status and runtime info
     """
-    fc = FabricClientCore()
-    
-    # Get workspace
-    workspace = fc.get_workspace_by_id(id=workspace_id)
-    workspace_id = workspace.id
-    
-    # List all items in workspace to find the notebook
-    ws_items = fc.list_items(workspace_id)
+    fc = _get_client()
     
     # Find the notebook by name
-    notebook_item = None
-    for item in ws_items:
-        if item.type == 'Notebook' and item.display_name == notebook_name:
-            notebook_item = item
-            break
+    notebook_item = _find_notebook(fc, workspace_id, notebook_name)
     
     if not notebook_item:
         raise Exception(f"Notebook '{notebook_name}' not found in workspace {workspace_id}")
@@ -35,7 +86,7 @@ def run_notebook_by_name(workspace_id, notebook_name):
     
     # Start the notebook execution
     print(f"Starting execution of '{notebook_name}'...")
-    start_time = time.time()
+    start_time = time.monotonic()
     
     # Enable inline installation for %pip commands
     execution_data = {"_inlineInstallationEnabled": True}
@@ -50,25 +101,31 @@ def run_notebook_by_name(workspace_id, notebook_name):
     print(f"Job started with ID: {job_instance.id}")
     print(f"Initial status: {job_instance.status}")
     
-    # Monitor the job until completion
-    while job_instance.status in ["InProgress", "NotStarted"]:
-        time.sleep(10)  # Wait 10 seconds before checking again
-        
-        # Get updated job status
-        job_instance = fc.get_item_job_instance(
-            workspace_id=workspace_id,
-            item_id=notebook_item.id,
-            job_instance_id=job_instance.id
-        )
-        
-        # Calculate runtime
-        runtime = time.time() - start_time
-        runtime_str = time.strftime("%H:%M:%S", time.gmtime(runtime))
-        
-        print(f"Status: {job_instance.status} - Runtime: {runtime_str}")
+    # Monitor the job until completion, rewriting one status line in place
+    attempt = 0
+    with Live(console=console, refresh_per_second=1, transient=True) as live:
+        while job_instance.status in PENDING_STATUSES:
+            time.sleep(_poll_sleep(attempt))
+            attempt += 1
+            
+            # Get updated job status
+            previous_status = job_instance.status
+            job_instance = fc.get_item_job_instance(
+                workspace_id=workspace_id,
+                item_id=notebook_item.id,
+                job_instance_id=job_instance.id
+            )
+            
+            # Start the backoff over once the job moves on (e.g. NotStarted -> InProgress),
+            # keeping each status change in the scrollback above the live line
+            if job_instance.status != previous_status:
+                attempt = 0
+                live.console.print(f"Status: {job_instance.status}")
+            
+            live.update(f"Status: {job_instance.status} - Runtime: {time.monotonic() - start_time:.0f}s")
     
     # Final status
-    total_runtime = time.time() - start_time
+    total_runtime = time.monotonic() - start_time
     total_runtime_str = time.strftime("%H:%M:%S", time.gmtime(total_runtime))
     
     result = {
@@ -105,10 +162,10 @@ def run_notebook_by_id(workspace_id, notebook_id):
     Returns:
         dict: Job execution results with status and runtime info
     """
-    fc = FabricClientCore()
+    fc = _get_client()
     
     print(f"Starting execution of notebook ID: {notebook_id}")
-    start_time = time.time()
+    start_time = time.monotonic()
     
     # Start the notebook execution with inline installation enabled
     execution_data = {"_inlineInstallationEnabled": True}
@@ -123,25 +180,31 @@ def run_notebook_by_id(workspace_id, notebook_id):
     print(f"Job started with ID: {job_instance.id}")
     print(f"Initial status: {job_instance.status}")
     
-    # Monitor the job until completion
-    while job_instance.status in ["InProgress", "NotStarted"]:
-        time.sleep(10)  # Wait 10 seconds before checking again
-        
-        # Get updated job status
-        job_instance = fc.get_item_job_instance(
-            workspace_id=workspace_id,
-            item_id=notebook_id,
-            job_instance_id=job_instance.id
-        )
-        
-        # Calculate runtime
-        runtime = time.time() - start_time
-        runtime_str = time.strftime("%H:%M:%S", time.gmtime(runtime))
-        
-        print(f"Status: {job_instance.status} - Runtime: {runtime_str}")
+    # Monitor the job until completion, rewriting one status line in place
+    attempt = 0
+    with Live(console=console, refresh_per_second=1, transient=True) as live:
+        while job_instance.status in PENDING_STATUSES:
+            time.sleep(_poll_sleep(attempt))
+            attempt += 1
+            
+            # Get updated job status
+            previous_status = job_instance.status
+            job_instance = fc.get_item_job_instance(
+                workspace_id=workspace_id,
+                item_id=notebook_id,
+                job_instance_id=job_instance.id
+            )
+            
+            # Start the backoff over once the job moves on (e.g. NotStarted -> InProgress),
+            # keeping each status change in the scrollback above the live line
+            if job_instance.status != previous_status:
+                attempt = 0
+                live.console.print(f"Status: {job_instance.status}")
+            
+            live.update(f"Status: {job_instance.status} - Runtime: {time.monotonic() - start_time:.0f}s")
     
     # Final status
-    total_runtime = time.time() - start_time
+    total_runtime = time.monotonic() - start_time
     total_runtime_str = time.strftime("%H:%M:%S", time.gmtime(total_runtime))
     
     result = {
@@ -165,6 +228,110 @@ def run_notebook_by_id(workspace_id, notebook_id):
     
     return result
 
+async def arun_notebook_by_id(workspace_id, notebook_id):
+    """
+    Run a Fabric notebook by its ID without blocking the event loop.
+    
+    The SDK is synchronous, so its calls run in worker threads while the
+    waits between polls are asyncio sleeps; many runs can share one loop.
+    
+    Args:
+        workspace_id: The Fabric workspace ID
+        notebook_id: The ID of the notebook to run
+        
+    Returns:
+        dict: Job execution results with status and runtime info
+    """
+    fc = _get_client()
+    
+    print(f"[{notebook_id}] Starting execution")
+    start_time = time.monotonic()
+    
+    # Start the notebook execution with inline installation enabled
+    execution_data = {"_inlineInstallationEnabled": True}
+    
+    job_instance = await asyncio.to_thread(
+        fc.run_on_demand_item_job,
+        workspace_id=workspace_id, 
+        item_id=notebook_id, 
+        job_type="RunNotebook",
+        execution_data=execution_data
+    )
+    
+    print(f"[{notebook_id}] Job started with ID: {job_instance.id}")
+    
+    # Monitor the job until completion
+    attempt = 0
+    while job_instance.status in PENDING_STATUSES:
+        await asyncio.sleep(_poll_sleep(attempt))
+        attempt += 1
+        
+        # Get updated job status
+        previous_status = job_instance.status
+        job_instance = await asyncio.to_thread(
+            fc.get_item_job_instance,
+            workspace_id=workspace_id,
+            item_id=notebook_id,
+            job_instance_id=job_instance.id
+        )
+        
+        # Start the backoff over once the job moves on (e.g. NotStarted -> InProgress);
+        # other jobs share the console, so only status changes are printed
+        if job_instance.status != previous_status:
+            attempt = 0
+            print(f"[{notebook_id}] Status: {job_instance.status} - Runtime: {time.monotonic() - start_time:.0f}s")
+    
+    # Final status
+    total_runtime = time.monotonic() - start_time
+    total_runtime_str = time.strftime("%H:%M:%S", time.gmtime(total_runtime))
+    
+    print(f"[{notebook_id}] Execution ended with status: {job_instance.status} ({total_runtime_str})")
+    
+    return {
+        'notebook_id': notebook_id,
+        'job_id': job_instance.id,
+        'status': job_instance.status,
+        'total_runtime': total_runtime,
+        'total_runtime_str': total_runtime_str,
+        'success': job_instance.status == "Completed"
+    }
+
+async def arun_notebook_by_name(workspace_id, notebook_name):
+    """
+    Run a Fabric notebook by its display name without blocking the event loop.
+    
+    Args:
+        workspace_id: The Fabric workspace ID
+        notebook_name: The display name of the notebook to run
+        
+    Returns:
+        dict: Job execution results with status and runtime info
+    """
+    notebook_item = await asyncio.to_thread(_find_notebook, _get_client(), workspace_id, notebook_name)
+    
+    if not notebook_item:
+        raise Exception(f"Notebook '{notebook_name}' not found in workspace {workspace_id}")
+    
+    result = await arun_notebook_by_id(workspace_id, notebook_item.id)
+    result['notebook_name'] = notebook_name
+    return result
+
+def run_notebooks_by_id(workspace_id, notebook_ids):
+    """
+    Run several Fabric notebooks concurrently and wait for all of them.
+    
+    Args:
+        workspace_id: The Fabric workspace ID
+        notebook_ids: IDs of the notebooks to run
+        
+    Returns:
+        list: Job execution results, in the order of notebook_ids
+    """
+    async def run_all():
+        return await asyncio.gather(*(arun_notebook_by_id(workspace_id, nid) for nid in notebook_ids))
+    
+    return asyncio.run(run_all())
+
 def get_notebook_id_by_name(workspace_id, notebook_name):
     """
     Get a notebook's ID by its display name.
@@ -176,21 +343,11 @@ def get_notebook_id_by_name(workspace_id, notebook_name):
     Returns:
         str: The notebook ID, or None if not found
     """
-    fc = FabricClientCore()
-    
-    # Get workspace
-    workspace = fc.get_workspace_by_id(id=workspace_id)
-    workspace_id = workspace.id
-    
-    # List all items in workspace
-    ws_items = fc.list_items(workspace_id)
+    fc = _get_client()
     
     # Find the notebook by name
-    for item in ws_items:
-        if item.type == 'Notebook' and item.display_name == notebook_name:
-            return item.id
-    
-    return None
+    notebook_item = _find_notebook(fc, workspace_id, notebook_name)
+    return notebook_item.id if notebook_item else None
 
 def list_notebooks_in_workspace(workspace_id):
     """
@@ -202,11 +359,7 @@ def list_notebooks_in_workspace(workspace_id):
     Returns:
         list: List of notebook items with id and display_name
     """
-    fc = FabricClientCore()
-    
-    # Get workspace
-    workspace = fc.get_workspace_by_id(id=workspace_id)
-    workspace_id = workspace.id
+    fc = _get_client()
     
     # Get all notebooks
     notebooks = fc.list_notebooks(workspace_id)